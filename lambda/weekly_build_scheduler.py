@@ -1,40 +1,91 @@
 import argparse
+import asyncio
+import contextlib
 import re
-from json import JSONDecodeError
-from datadog_api_client import ApiClient, Configuration
-from datadog_api_client.v2.api.service_definition_api import ServiceDefinitionApi
-from datadog_api_client.v2.model.service_definition_schema_versions import ServiceDefinitionSchemaVersions
+from collections.abc import AsyncIterator
 from datetime import datetime, timedelta, timezone
+import aiohttp
+import functools
+import ijson
 import logging
+import orjson
 import os
-import requests
 import sys
-import json
+import time
 
 logging.basicConfig(format="%(asctime)s - %(levelname)8s: %(message)s", stream=sys.stdout)
-logging.getLogger("requests").setLevel(logging.CRITICAL)
+logging.getLogger("aiohttp").setLevel(logging.CRITICAL)
 logging.getLogger("urllib3").setLevel(logging.CRITICAL)
 
 SCHEDULE = ""  # Set desired cron formatted pattern for scheduled pipelines (e.g. "0 0 13 ? * 7 *")
 WORKSPACE = ""  # Set Bitbucket workspace name to be used in HTTP requests
+BB_REPO_BASE = f"https://api.bitbucket.org/2.0/repositories/{WORKSPACE}"
+MAX_CONCURRENT_REQUESTS = 8  # Cap on the number of repos processed against Bitbucket at once
+POOL_SIZE = 32  # Cap on the number of pooled connections kept open against api.bitbucket.org
+RETRY_STATUSES = frozenset({429, 502, 503, 504})  # Transient statuses worth retrying
+DD_PAGE_WINDOW = 8  # Number of Datadog service catalog pages fetched in parallel
+DD_SITE = os.getenv("DD_SITE", "datadoghq.com")  # Same site selection the Datadog SDK honours
+DD_SERVICES_URL = f"https://api.{DD_SITE}/api/v2/services/definitions"
+HEADERS_JSON_POST = {"Content-Type": "application/json"}  # The session already supplies Accept
+
+# Default branch names cached for the lifetime of the Lambda container (warm starts),
+# revalidated with conditional requests via the ETags stored alongside them
+_DEFAULT_BRANCHES: dict[str, str] = {}
+_ETAGS: dict[str, str] = {}
+
+# Service catalog results cached across warm invocations, as (fetch time, services)
+SERVICES_CACHE_TTL = 300  # Seconds before the Datadog service catalog is refetched
+_SERVICES_CACHE: tuple[float, list[str]] | None = None
+
+
+async def _request(session: aiohttp.ClientSession, method: str, url: str,
+                   retries: int = 3, backoff: float = 0.3, read: bool = True,
+                   **kwargs) -> aiohttp.ClientResponse:
+    """
+    Issue an HTTP request, retrying transient failures with exponential backoff
+
+    :param session: the HTTP session shared by all Bitbucket requests
+    :param method: the HTTP method to use
+    :param url: the URL to request
+    :param retries: the number of attempts to make before giving up
+    :param backoff: the base delay in seconds between attempts
+    :param read: whether to read the body up front; if False the caller owns the response
+    :return: the response, with its body read and cached so the caller can parse it
+    """
+    for attempt in range(retries):
+        response = await session.request(method, url, **kwargs)
+
+        if response.status in RETRY_STATUSES and attempt < retries - 1:
+            response.release()
+            await asyncio.sleep(backoff * 2 ** attempt)
+            continue
 
+        if read:
+            # Reading to EOF returns the connection to the pool; an explicit
+            # release() would make later reads of the cached body raise
+            await response.read()
+        return response
 
-def get_default_branch(repo_slug: str) -> str | None:
+
+async def get_default_branch(session: aiohttp.ClientSession, repo_slug: str) -> str | None:
     """
     Get the name of a repository's default branch.
 
+    :param session: the HTTP session shared by all Bitbucket requests
     :param repo_slug: the repository the default branch is being retrieved from
     :return: the name of a repositories default branch
     """
-    url = f"https://api.bitbucket.org/2.0/repositories/{WORKSPACE}/{repo_slug}/refs/branches/"
-
-    headers = {
-        "Accept": "application/json"
-    }
+    url = f"{BB_REPO_BASE}/{repo_slug}/refs/branches/"
 
     auth = get_bitbucket_credentials()
 
-    response = requests.request(
+    # Send the cached ETag so an unchanged branch list comes back as a bodyless 304
+    headers = {}
+    if repo_slug in _ETAGS:
+        headers["If-None-Match"] = _ETAGS[repo_slug]
+
+    response = await _request(
+        session,
         "GET",
         url,
         auth=auth,
@@ -44,145 +95,137 @@ def get_default_branch(repo_slug: str) -> str | None:
         }
     )
 
-    try:
-        if "error" in json.loads(response.text):
-            logging.error("Failed to get default branch name: " + json.loads(response.text)["error"]["message"])
-            return
+    if response.status == 304:
+        return _DEFAULT_BRANCHES.get(repo_slug)
 
-        branches = json.loads(response.text)['values']
-    except JSONDecodeError:
-        logging.error("Failed to get default branch name: " + response.reason)
+    if not response.ok:
+        logging.error(f"Failed to get default branch name: {response.status} {response.reason}")
+        return
+
+    try:
+        branches = orjson.loads(await response.read())['values']
+    except orjson.JSONDecodeError:
+        logging.error("Failed to get default branch name: could not decode response body")
         return
 
     default_branch = branches[0]["name"]
+
+    etag = response.headers.get("ETag")
+    if etag is not None:
+        _ETAGS[repo_slug] = etag
+    _DEFAULT_BRANCHES[repo_slug] = default_branch
     return default_branch
 
 
-def get_schedules(repo_slug: str) -> dict | None:
+async def get_schedules(session: aiohttp.ClientSession, repo_slug: str) -> dict | None:
     """
     Get all scheduled pipelines for a repo
 
+    :param session: the HTTP session shared by all Bitbucket requests
     :param repo_slug: the name of the repo to retrieve the scheduled pipelines from
     :return: all scheduled pipelines for a repo
     """
     logging.debug(f"Retrieving scheduled pipelines for repo: {repo_slug}...")
 
-    url = f"https://api.bitbucket.org/2.0/repositories/{WORKSPACE}/{repo_slug}/pipelines_config/schedules"
-
-    headers = {
-        "Accept": "application/json"
-    }
+    url = f"{BB_REPO_BASE}/{repo_slug}/pipelines_config/schedules"
 
     auth = get_bitbucket_credentials()
 
-    response = requests.request(
+    response = await _request(
+        session,
         "GET",
         url,
-        auth=auth,
-        headers=headers
+        auth=auth
     )
 
+    if not response.ok:
+        logging.error(f"Failed to retrieve scheduled pipelines: {response.status} {response.reason}")
+        return
+
     try:
-        if "error" in json.loads(response.text):
-            logging.error("Failed to retrieve scheduled pipelines: " + json.loads(response.text)["error"]["message"])
-            return
-    except JSONDecodeError:
-        logging.error("Failed to retrieve scheduled pipelines: " + response.reason)
+        schedules = orjson.loads(await response.read())['values']
+    except orjson.JSONDecodeError:
+        logging.error("Failed to retrieve scheduled pipelines: could not decode response body")
         return
 
-    schedules = json.loads(response.text)['values']
     return schedules
 
 
-def delete_schedule(repo_slug: str, dry_run: bool) -> None:
+def _index_schedules(schedules: list) -> dict:
+    """
+    Index scheduled pipelines by their cron pattern and target branch pattern
+
+    :param schedules: the scheduled pipelines for a repo
+    :return: a dict mapping (cron_pattern, target pattern) pairs to schedules
+    """
+    return {(schedule["cron_pattern"], schedule["target"]["selector"]["pattern"]): schedule
+            for schedule in schedules}
+
+
+async def delete_schedule(session: aiohttp.ClientSession, repo_slug: str, dry_run: bool,
+                          schedule: dict | None) -> None:
     """
     Delete a scheduled pipeline
 
+    :param session: the HTTP session shared by all Bitbucket requests
     :param repo_slug: the name of the repo containing the to-be-deleted scheduled pipeline
     :param dry_run: a flag that causes script to not make changes
+    :param schedule: the schedule to delete, or None if the repo has no matching schedule
     """
     logging.debug(f"Deleting scheduled pipeline for repo: {repo_slug}...")
 
-    default_branch = get_default_branch(repo_slug)
-    schedules = get_schedules(repo_slug)
-
-    if schedules is None:
-        if dry_run:
-            logging.error("")
-        else:
-            logging.error("Failed to delete scheduled pipeline.")
-        return
-
     if dry_run:
         logging.info(f"Eligible for Schedule Deletion: {repo_slug}")
         return
 
-    for schedule in schedules:
-        # Delete any schedule set to run on Saturday at 13:00 UTC that is targeting the default branch
-        if schedule['cron_pattern'] == SCHEDULE and schedule['target']['selector']['pattern'] == default_branch:
-            schedule_uuid = schedule["uuid"]
-            url = (f"https://api.bitbucket.org/2.0/repositories/{WORKSPACE}/{repo_slug}/"
-                   f"pipelines_config/schedules/{schedule_uuid}")
-
-            headers = {
-                "Accept": "application/json"
-            }
+    if schedule is None:
+        return
 
-            auth = get_bitbucket_credentials()
+    schedule_uuid = schedule["uuid"]
+    url = f"{BB_REPO_BASE}/{repo_slug}/pipelines_config/schedules/{schedule_uuid}"
 
-            response = requests.request(
-                "DELETE",
-                url,
-                auth=auth,
-                headers=headers
-            )
+    auth = get_bitbucket_credentials()
 
-            try:
-                if "error" in json.loads(response.text):
-                    logging.error("Failed to delete scheduled pipeline: " +
-                                  json.loads(response.text)["error"]["message"])
-                    return
-            except JSONDecodeError:
-                if response.status_code != 204:
-                    logging.error("Failed to delete scheduled pipeline: " + response.reason)
-                    return
+    response = await _request(
+        session,
+        "DELETE",
+        url,
+        auth=auth
+    )
 
-            break
+    if not response.ok:
+        logging.error(f"Failed to delete scheduled pipeline: {response.status} {response.reason}")
+        return
 
     logging.debug(f"Scheduled pipeline deleted for repo: {repo_slug}.")
 
 
-def create_schedule(repo_slug: str, dry_run: bool) -> None:
+async def create_schedule(session: aiohttp.ClientSession, repo_slug: str, dry_run: bool,
+                          default_branch: str | None, existing_schedule: dict | None) -> None:
     """
     Create a scheduled pipeline in a repo
 
+    :param session: the HTTP session shared by all Bitbucket requests
     :param repo_slug: the name of the repo to create a scheduled pipeline in
     :param dry_run: a flag that causes script to not make changes
+    :param default_branch: the repo's default branch, targeted by the new schedule
+    :param existing_schedule: a matching schedule that already exists, if any
     """
     logging.debug(f"Creating scheduled pipeline for repo: {repo_slug}...")
 
-    default_branch = get_default_branch(repo_slug)
-    schedules = get_schedules(repo_slug)
-
-    for schedule in schedules:
-        if schedule['cron_pattern'] == SCHEDULE and schedule['target']['selector']['pattern'] == default_branch:
-            logging.error("Failed to create scheduled pipeline: this schedule already exists.")
-            return
+    if existing_schedule is not None:
+        logging.error("Failed to create scheduled pipeline: this schedule already exists.")
+        return
 
     if dry_run:
         logging.info(f"Eligible for Scheduling: {repo_slug}")
         return
 
-    url = f"https://api.bitbucket.org/2.0/repositories/{WORKSPACE}/{repo_slug}/pipelines_config/schedules"
-
-    headers = {
-        "Accept": "application/json",
-        "Content-Type": "application/json"
-    }
+    url = f"{BB_REPO_BASE}/{repo_slug}/pipelines_config/schedules"
 
     auth = get_bitbucket_credentials()
 
-    payload = json.dumps(
+    payload = orjson.dumps(
         {
             "type": "pipeline_schedule",
             "target": {
@@ -199,171 +242,248 @@ def create_schedule(repo_slug: str, dry_run: bool) -> None:
         }
     )
 
-    response = requests.request(
+    response = await _request(
+        session,
         "POST",
         url,
         auth=auth,
         data=payload,
-        headers=headers
+        headers=HEADERS_JSON_POST
     )
 
-    try:
-        if "error" in json.loads(response.text):
-            logging.error("Failed to create scheduled pipeline: " + json.loads(response.text)["error"]["message"])
-            return
-    except JSONDecodeError:
-        logging.error("Failed to create scheduled pipeline: " + response.reason)
+    if not response.ok:
+        logging.error(f"Failed to create scheduled pipeline: {response.status} {response.reason}")
         return
 
     logging.debug(f"Scheduled pipeline created for repo: {repo_slug}.")
 
 
-def check_development_status(pipelines: list, test: bool) -> bool:
+async def check_development_status(pipelines: AsyncIterator[dict], test: bool) -> bool | None:
     """
     Determine if a repository is currently in development
 
-    :param pipelines: a page of the latest pipelines in the repo
+    :param pipelines: an async iterator over the latest pipelines in the repo
     :param test: a flag that sets the recent build time to 2 minutes
-    :return: a boolean determining if a repository is in development
+    :return: whether the repository is in development, or None if it has no pipelines
     """
     logging.debug("Checking development status...")
 
     recent_pipelines = 0
+    total_pipelines = 0
 
-    for pipeline in pipelines:
-        # Convert created_on date value to usable datetime format
-        creation_str = pipeline["created_on"].replace("T", " ").replace("Z", "")
-        creation_date = datetime.strptime(creation_str, '%Y-%m-%d %H:%M:%S.%f')
+    # Today's date in UTC and the recency window are invariant across pipelines
+    today = datetime.now(tz=timezone.utc)
 
-        # Get today's date in UTC
-        today_str = datetime.now(tz=timezone.utc).strftime('%Y-%m-%d %H:%M:%S.%f')
-        today = datetime.strptime(today_str, '%Y-%m-%d %H:%M:%S.%f')
+    if test:
+        recent = timedelta(minutes=2)
+    else:
+        recent = timedelta(weeks=1)
 
-        if test:
-            recent = timedelta(minutes=2)
-        else:
-            recent = timedelta(weeks=1)
+    async with contextlib.aclosing(pipelines):
+        async for pipeline in pipelines:
+            total_pipelines += 1
+
+            # created_on is ISO 8601; fromisoformat accepts the trailing Z on Python 3.11+
+            creation_date = datetime.fromisoformat(pipeline["created_on"])
 
-        # Check if pipeline was executed by user recently
-        if today - creation_date <= recent:
+            # Pipelines arrive newest first, so everything after a stale one is older still
+            if today - creation_date > recent:
+                break
+
+            # The pipeline was executed by a user recently
             recent_pipelines += 1
 
             if pipeline["trigger"]["name"] != "SCHEDULE" or recent_pipelines > 1:
                 logging.debug("This repo is in development.")
                 return True
 
+    if total_pipelines == 0:
+        return None
+
     logging.debug("This repo is not in development")
     return False
 
 
-def get_bitbucket_credentials() -> tuple:
+@functools.lru_cache(maxsize=1)
+def get_bitbucket_credentials() -> aiohttp.BasicAuth:
     """
     Get Bitbucket credentials from environment
 
     :return: Bitbucket credentials
     """
-    return os.getenv('BB_USER_ID'), os.getenv('BB_APP_PASS')
+    return aiohttp.BasicAuth(os.getenv('BB_USER_ID'), os.getenv('BB_APP_PASS'))
 
 
-def get_latest_pipelines(repo_slug: str) -> list | None:
+async def get_latest_pipelines(session: aiohttp.ClientSession, repo_slug: str) -> AsyncIterator[dict]:
     """
-    Get a page of the latest pipelines in a repository
+    Stream a page of the latest pipelines in a repository
+
+    Pipelines are parsed incrementally, so a caller that stops iterating early
+    never decodes the remainder of the page.
 
+    :param session: the HTTP session shared by all Bitbucket requests
     :param repo_slug: the name of the repo containing the pipelines to be retrieved
-    :return: the latest pipelines
+    :return: an async iterator over the latest pipelines
     """
     logging.debug(f"Retrieving latest pipelines for repo: {repo_slug}...")
 
-    url = f"https://api.bitbucket.org/2.0/repositories/{WORKSPACE}/{repo_slug}/pipelines"
-
-    headers = {
-        "Accept": "application/json"
-    }
+    url = f"{BB_REPO_BASE}/{repo_slug}/pipelines"
 
     auth = get_bitbucket_credentials()
 
-    response = requests.request(
+    response = await _request(
+        session,
         "GET",
         url,
         auth=auth,
-        headers=headers,
         params={
             "sort": "-created_on"
-        }
+        },
+        read=False
     )
 
     try:
-        if "error" in json.loads(response.text):
-            logging.error("Failed to get latest pipelines: " + json.loads(response.text)["error"]["message"])
+        if not response.ok:
+            logging.error(f"Failed to get latest pipelines: {response.status} {response.reason}")
             return
 
-        pipelines = json.loads(response.text)['values']
-    except JSONDecodeError:
-        logging.error("Failed to get latest pipelines: " + response.reason)
-        return
-
-    return pipelines
+        async for pipeline in ijson.items(response.content, "values.item"):
+            yield pipeline
+    except ijson.JSONError:
+        logging.error(f"Failed to get latest pipelines: {response.status} {response.reason}")
+    finally:
+        # Fully-drained connections go back to the pool; half-read ones are closed
+        response.release()
 
 
-def match_override(repo_slug: str, override: list | tuple) -> bool:
+def match_override(repo_slug: str, override: list[re.Pattern]) -> bool:
     """
     Search for a repository in the override list
 
     :param repo_slug: A repo slug to search for in the list of override patterns
-    :param override: A list of patterns to ignore
+    :param override: A list of pre-compiled patterns to ignore
     :return: a boolean dictating if a repo slug should be ignored
     """
-    for pattern in override:
-        pattern = re.compile(pattern)
-        if pattern.search(repo_slug) is not None:
-            return True
+    return any(pattern.search(repo_slug) is not None for pattern in override)
 
-    return False
 
+async def _get_service_definition_page(session: aiohttp.ClientSession, headers: dict,
+                                       page_number: int) -> tuple[list, int] | None:
+    """
+    Stream one page of the Datadog service catalog and extract its repo names
 
-def get_active_services() -> list:
+    Service definitions are parsed one at a time with ijson, so whole pages of
+    definition objects are never materialized just to read a single URL each.
+
+    :param session: the HTTP session shared by all requests
+    :param headers: the Datadog authentication headers
+    :param page_number: the catalog page to fetch
+    :return: the repo names on the page and the number of definitions read,
+             or None if the fetch failed
+    """
+    response = await _request(
+        session,
+        "GET",
+        DD_SERVICES_URL,
+        headers=headers,
+        params={
+            "schema_version": "v2.1",
+            "page[number]": page_number
+        },
+        read=False
+    )
+
+    repos = []
+    definitions = 0
+
+    try:
+        if not response.ok:
+            logging.error(f"Failed to retrieve service definitions: {response.status} {response.reason}")
+            return
+
+        async for service in ijson.items(response.content, "data.item"):
+            definitions += 1
+
+            # Extract repo name from Bitbucket repo URL in service definition
+            url_components = service['attributes']['schema']['links'][-1]['url'].split("/")
+
+            if url_components[4] != "workspace":
+                repo_slug = url_components[4]
+                repos.append(repo_slug)
+    except ijson.JSONError:
+        logging.error(f"Failed to retrieve service definitions: {response.status} {response.reason}")
+        return
+    finally:
+        # Fully-drained connections go back to the pool; half-read ones are closed
+        response.release()
+
+    return repos, definitions
+
+
+async def get_active_services(session: aiohttp.ClientSession) -> list:
     """
     Retrieve the repo names associated with the services listed in the Datadog service catalog
 
+    :param session: the HTTP session shared by all requests
     :return: a list of repository names
     """
+    global _SERVICES_CACHE
+
+    # The catalog changes infrequently; reuse a recent result on warm invocations.
+    # cachetools' ttl_cache does not work on coroutines, so the cache is hand-rolled.
+    if _SERVICES_CACHE is not None and time.monotonic() - _SERVICES_CACHE[0] < SERVICES_CACHE_TTL:
+        logging.info("Reusing cached active services...")
+        return _SERVICES_CACHE[1]
+
     logging.info("Retrieving active services...")
 
     services = []
 
-    configuration = Configuration()
-    with ApiClient(configuration) as api_client:
-        api_instance = ServiceDefinitionApi(api_client)
-        page = 0
+    headers = {
+        "DD-API-KEY": os.getenv("DD_API_KEY"),
+        "DD-APPLICATION-KEY": os.getenv("DD_APP_KEY")
+    }
+
+    page = 0
+    complete = False
+
+    # Fetch pages in windows of 8 so their network latency overlaps instead of serializing
+    while True:
+        pages = await asyncio.gather(*[
+            _get_service_definition_page(session, headers, page_number)
+            for page_number in range(page, page + DD_PAGE_WINDOW)
+        ])
+
+        done = False
+        for result in pages:
+            # A failed fetch ends pagination without marking the run complete
+            if result is None:
+                done = True
+                break
 
-        while True:
-            response = api_instance.list_service_definitions(
-                schema_version=ServiceDefinitionSchemaVersions.V2_1,
-                page_number=page
-            )
+            repos, definitions = result
 
-            if "errors" in response:
-                logging.error(response["errors"][0])
+            # An empty page marks the end of the catalog
+            if definitions == 0:
+                done = True
+                complete = True
                 break
 
-            for service in response['data']:
-                # Extract repo name from Bitbucket repo URL in service definition
-                url_components = service['attributes']['schema']['links'][-1]['url'].split("/")
+            services.extend(repos)
 
-                if url_components[4] != "workspace":
-                    repo_slug = url_components[4]
-                    services.append(repo_slug)
+        if done:
+            break
 
-            # Stop making requests when the response is empty
-            if not response["data"]:
-                break
-            else:
-                page += 1
+        page += DD_PAGE_WINDOW
+
+    # Cache only full catalogs, so a transient failure is not served for the next 5 minutes
+    if complete:
+        _SERVICES_CACHE = (time.monotonic(), services)
 
     return services
 
 
-def process_services(repositories: list[str], override: list[str], dry_run: bool, test: bool) -> None:
+async def process_services(repositories: list[str], override: list[str], dry_run: bool, test: bool) -> None:
     """
     Begin processing services
 
@@ -374,31 +494,49 @@ def process_services(repositories: list[str], override: list[str], dry_run: bool
     """
     logging.info("Processing services...")
 
-    if repositories:
-        active_services = repositories
-    else:
-        active_services = get_active_services()
+    # Compile the override patterns once rather than on every match_override call
+    compiled_override = [re.compile(pattern) for pattern in (override or [])]
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
 
-    for i, service in enumerate(active_services):
-        logging.info(f"Processing service: {service}...")
+    async def handle(session: aiohttp.ClientSession, service: str) -> None:
+        async with semaphore:
+            logging.info(f"Processing service: {service}...")
 
-        if override:
-            if match_override(service, override):
+            if match_override(service, compiled_override):
                 logging.info(f"Bitbucket repo for service {service} overridden. Skipping...")
-                continue
+                return
 
-        pipelines = get_latest_pipelines(service)
+            # The three Bitbucket reads are independent, so issue them concurrently
+            default_branch, schedules, in_development = await asyncio.gather(
+                get_default_branch(session, service),
+                get_schedules(session, service),
+                check_development_status(get_latest_pipelines(session, service), test)
+            )
 
-        if not pipelines:
-            logging.info(f"No pipelines found in repo for service: {service}. Skipping...")
-            continue
+            if in_development is None:
+                logging.info(f"No pipelines found in repo for service: {service}. Skipping...")
+                return
+
+            if schedules is None:
+                logging.error(f"Could not retrieve scheduled pipelines for service: {service}. Skipping...")
+                return
 
-        in_development = check_development_status(pipelines, test)
+            existing_schedule = _index_schedules(schedules).get((SCHEDULE, default_branch))
 
-        if not in_development:
-            create_schedule(service, dry_run)
+            if not in_development:
+                await create_schedule(session, service, dry_run, default_branch, existing_schedule)
+            else:
+                await delete_schedule(session, service, dry_run, existing_schedule)
+
+    connector = aiohttp.TCPConnector(limit=POOL_SIZE)
+    async with aiohttp.ClientSession(connector=connector, headers={"Accept": "application/json"}) as session:
+        if repositories:
+            active_services = repositories
         else:
-            delete_schedule(service, dry_run)
+            active_services = await get_active_services(session)
+
+        await asyncio.gather(*[handle(session, service) for service in active_services])
 
     logging.info("Services processed.")
 
@@ -422,7 +560,7 @@ def lambda_handler(event: dict, _) -> None:
     else:
         logging.getLogger().setLevel(logging.INFO)
 
-    process_services(repositories, override, dry_run, test)
+    asyncio.run(process_services(repositories, override, dry_run, test))
 
 
 if __name__ == '__main__':